@@ -11,64 +11,72 @@ import shutil
 import re
 from datetime import datetime
 
-def load_edited_csv(csv_file):
-    """Load the edited artists CSV with proper handling of quoted fields"""
-    artists = []
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        # Use csv.DictReader with proper quoting to handle JSON arrays and commas
-        reader = csv.DictReader(f, quoting=csv.QUOTE_ALL)
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 because row 1 is header
-            try:
-                # Parse years_active with error handling
-                years_active = []
-                years_str = row.get('years_active', '').strip()
-                if years_str:
-                    # Remove quotes if present
-                    years_str = years_str.strip('"').strip("'")
-                    try:
-                        years_active = json.loads(years_str)
-                        if not isinstance(years_active, list):
-                            years_active = []
-                    except json.JSONDecodeError:
-                        # Try to extract years from malformed JSON
-                        # Look for numbers in brackets like [2006, 2007] or [2006,2007]
-                        years = re.findall(r'\d{4}', years_str)
-                        years_active = [int(y) for y in years] if years else []
-                        if years_active:
-                            print(f"  Warning: Row {row_num} had malformed years_active JSON, extracted years: {years_active}")
-                
-                # Clean up artist name (remove quotes)
-                artist_name = row.get('artist_name', '').strip().strip('"').strip("'")
-                normalized_name = row.get('normalized_name', '').strip().strip('"').strip("'")
-                
-                # Parse numeric fields with better error handling
-                def safe_int(value, default=0):
-                    if not value or not str(value).strip():
-                        return default
-                    value_str = str(value).strip().strip('"').strip("'")
-                    # Remove trailing brackets or other junk
-                    value_str = re.sub(r'[\]\[]+$', '', value_str)
-                    try:
-                        return int(value_str)
-                    except ValueError:
-                        return default
-                
-                artists.append({
-                    'artist_name': artist_name,
-                    'normalized_name': normalized_name,
-                    'total_shows': safe_int(row.get('total_shows'), 0),
-                    'connection_count': safe_int(row.get('connection_count'), 0),
-                    'first_year': safe_int(row.get('first_year'), None) if row.get('first_year') else None,
-                    'last_year': safe_int(row.get('last_year'), None) if row.get('last_year') else None,
-                    'years_span': safe_int(row.get('years_span'), 0),
-                    'years_active': years_active
-                })
-            except Exception as e:
-                print(f"  Error processing row {row_num}: {e}")
-                print(f"  Artist name: {row.get('artist_name', 'N/A')}")
-                continue
-    
+import orjson
+import pandas as pd
+
+CSV_FIELDNAMES = ['artist_name', 'normalized_name', 'total_shows', 'connection_count',
+                  'years_active', 'first_year', 'last_year', 'years_span']
+
+# Compiled once; these run for every row of the artists CSV
+_YEARS_RE = re.compile(r'\d{4}')
+_TRAIL_BRACKETS_RE = re.compile(r'[\]\[]+$')
+
+def _encode_years_active(years):
+    """Serialize a years_active list of ints; same output as json.dumps but
+    a plain C-level join beats a full JSON encoder call per row"""
+    return '[' + ', '.join(map(str, years)) + ']'
+
+def _parse_years_active(years_str):
+    """Parse a years_active cell, salvaging years from malformed JSON"""
+    years_str = years_str.strip().strip('"').strip("'")
+    if not years_str:
+        return []
+    try:
+        years_active = json.loads(years_str)
+        return years_active if isinstance(years_active, list) else []
+    except json.JSONDecodeError:
+        # Look for numbers in brackets like [2006, 2007] or [2006,2007]
+        years = _YEARS_RE.findall(years_str)
+        if years:
+            print(f"  Warning: malformed years_active JSON {years_str!r}, extracted years: {years}")
+        return [int(y) for y in years]
+
+def load_edited_csv(csv_file, as_map=False):
+    """Load the edited artists CSV with proper handling of quoted fields
+
+    Returns a list of artist dicts, or with as_map=True a dict keyed by
+    normalized_name (what every downstream consumer actually wants).
+    """
+    df = pd.read_csv(csv_file, dtype=str, quoting=csv.QUOTE_ALL)
+    df = df.reindex(columns=CSV_FIELDNAMES).fillna('')
+
+    # Strip stray whitespace/quoting left over from the editor export,
+    # column-at-a-time instead of per cell
+    def clean_str_col(col):
+        return df[col].str.strip().str.strip('"').str.strip("'")
+
+    df['artist_name'] = clean_str_col('artist_name')
+    df['normalized_name'] = clean_str_col('normalized_name')
+
+    # Numeric columns: drop trailing bracket junk, coerce bad values to the default
+    def int_col(col, default=0):
+        cleaned = clean_str_col(col).str.replace(_TRAIL_BRACKETS_RE, '', regex=True)
+        numeric = pd.to_numeric(cleaned, errors='coerce')
+        if default is None:
+            return numeric.map(lambda v: int(v) if pd.notna(v) else None)
+        return numeric.fillna(default).astype('int64')
+
+    df['total_shows'] = int_col('total_shows')
+    df['connection_count'] = int_col('connection_count')
+    df['first_year'] = int_col('first_year', default=None)
+    df['last_year'] = int_col('last_year', default=None)
+    df['years_span'] = int_col('years_span')
+    df['years_active'] = df['years_active'].map(_parse_years_active)
+
+    artists = df.to_dict('records')
     print(f"Successfully loaded {len(artists)} artists from CSV")
+    if as_map:
+        return {artist['normalized_name']: artist for artist in artists}
     return artists
 
 def load_changes_log(json_file):
@@ -79,8 +87,8 @@ def load_changes_log(json_file):
 def apply_changes_to_network(network_file, changes, artists_map):
     """Apply editor changes to network data"""
     print(f"Loading network data from {network_file}...")
-    with open(network_file, 'r', encoding='utf-8') as f:
-        network_data = json.load(f)
+    with open(network_file, 'rb') as f:
+        network_data = orjson.loads(f.read())
     
     # Process changes
     name_mapping = {}  # old normalized -> new normalized
@@ -127,40 +135,37 @@ def apply_changes_to_network(network_file, changes, artists_map):
         
         updated_nodes.append(node)
     
-    # Update edges
+    # Update edges: map names, drop removed nodes/self-loops, and dedup in
+    # a single pass instead of building an intermediate edge list
     print("Updating edges...")
-    updated_edges = []
-    
+    seen_edges = set()
+    final_edges = []
+
     for edge in network_data['edges']:
         source = edge['source']
         target = edge['target']
-        
+
         # Skip if either node was removed
         if source in nodes_to_remove or target in nodes_to_remove:
             continue
-        
+
         # Map names
-        if source in name_mapping:
-            source = name_mapping[source]
-        if target in name_mapping:
-            target = name_mapping[target]
-        
+        source = name_mapping.get(source, source)
+        target = name_mapping.get(target, target)
+
         # Skip self-loops
         if source == target:
             continue
-        
+
+        # Order-independent key without the list+sort allocation
+        edge_key = (source, target) if source < target else (target, source)
+        if edge_key in seen_edges:
+            continue
+        seen_edges.add(edge_key)
+
         edge['source'] = source
         edge['target'] = target
-        updated_edges.append(edge)
-    
-    # Remove duplicate edges
-    seen_edges = set()
-    final_edges = []
-    for edge in updated_edges:
-        edge_key = tuple(sorted([edge['source'], edge['target']]))
-        if edge_key not in seen_edges:
-            seen_edges.add(edge_key)
-            final_edges.append(edge)
+        final_edges.append(edge)
     
     network_data['nodes'] = updated_nodes
     network_data['edges'] = final_edges
@@ -173,20 +178,21 @@ def find_latest_file(directory, pattern):
     """Find the most recent file matching a pattern in a directory"""
     if not os.path.exists(directory):
         return None
-    
-    matching_files = []
-    for filename in os.listdir(directory):
-        if pattern in filename.lower():
-            filepath = os.path.join(directory, filename)
-            if os.path.isfile(filepath):
-                matching_files.append((filepath, os.path.getmtime(filepath)))
-    
-    if not matching_files:
-        return None
-    
-    # Sort by modification time, most recent first
-    matching_files.sort(key=lambda x: x[1], reverse=True)
-    return matching_files[0][0]
+
+    # scandir hands back cached stat info with each entry, so this is one
+    # directory read instead of a listdir plus a stat per file; a running
+    # max also avoids building and sorting the full list
+    latest_path = None
+    latest_mtime = -1.0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if pattern in entry.name.lower() and entry.is_file():
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime = mtime
+                    latest_path = entry.path
+
+    return latest_path
 
 def main():
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -254,11 +260,10 @@ def main():
         else:
             print(f"Warning: Changes JSON not found: {changes_json}, continuing without it\n")
     
-    # Load edited artists
+    # Load edited artists straight into the normalized_name -> artist map
     print(f"\nLoading edited artists from {edited_csv}...")
-    artists = load_edited_csv(edited_csv)
-    artists_map = {a['normalized_name']: a for a in artists}
-    print(f"Loaded {len(artists)} artists")
+    artists_map = load_edited_csv(edited_csv, as_map=True)
+    print(f"Loaded {len(artists_map)} artists")
     
     # Backup original files
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -283,15 +288,9 @@ def main():
     # Update artists CSV
     print("\nUpdating artists CSV files...")
     output_csv = os.path.join(project_root, 'data', 'processed', 'artists_20260102_211457.csv')
-    with open(output_csv, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['artist_name', 'normalized_name', 'total_shows', 
-                                               'connection_count', 'years_active', 'first_year', 
-                                               'last_year', 'years_span'])
-        writer.writeheader()
-        for artist in artists:
-            row = artist.copy()
-            row['years_active'] = json.dumps(artist['years_active'])
-            writer.writerow(row)
+    out_df = pd.DataFrame(artists_map.values(), columns=CSV_FIELDNAMES)
+    out_df['years_active'] = out_df['years_active'].map(_encode_years_active)
+    out_df.to_csv(output_csv, index=False, encoding='utf-8')
     print(f"✅ Updated: {output_csv}")
     
     # Copy to webapp
@@ -305,15 +304,16 @@ def main():
         print("\nUpdating network data...")
         updated_network = apply_changes_to_network(network_file, changes, artists_map)
         
-        # Save updated network
-        with open(network_file, 'w', encoding='utf-8') as f:
-            json.dump(updated_network, f, indent=2, default=str)
+        # Save updated network (orjson serializes the big graph far faster
+        # than stdlib json with indent=2)
+        with open(network_file, 'wb') as f:
+            f.write(orjson.dumps(updated_network, option=orjson.OPT_INDENT_2, default=str))
         print(f"✅ Updated: {network_file}")
         
-        # Copy to webapp
+        # Copy to webapp — the bytes were just written, no need to
+        # re-serialize the whole graph
         webapp_network = os.path.join(project_root, 'webapp', 'network_data.json')
-        with open(webapp_network, 'w', encoding='utf-8') as f:
-            json.dump(updated_network, f, indent=2, default=str)
+        shutil.copyfile(network_file, webapp_network)
         print(f"✅ Updated: {webapp_network}")
     
     print(f"\n✅ All changes applied!")
@@ -20,23 +20,26 @@ def main():
     exported_csv = input("Enter path to exported shows CSV (or press Enter to auto-detect): ").strip()
     
     if not exported_csv:
-        # First, look in data/downloads/
-        csv_files = []
-        if os.path.exists(data_downloads_dir):
-            csv_files = [f for f in os.listdir(data_downloads_dir) 
-                        if f.startswith('velour_shows_edited_') and f.endswith('.csv')]
-            csv_files = [os.path.join(data_downloads_dir, f) for f in csv_files]
-        
-        # Also check user Downloads folder
-        if os.path.exists(user_downloads_dir):
-            user_csv_files = [f for f in os.listdir(user_downloads_dir) 
-                             if f.startswith('velour_shows_edited_') and f.endswith('.csv')]
-            csv_files.extend([os.path.join(user_downloads_dir, f) for f in user_csv_files])
-        
+        # Scan with os.scandir so each entry's mtime comes from the directory
+        # read itself rather than a separate stat per file
+        def find_exported_csvs(directory):
+            found = []
+            if os.path.exists(directory):
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if (entry.name.startswith('velour_shows_edited_')
+                                and entry.name.endswith('.csv') and entry.is_file()):
+                            found.append((entry.path, entry.stat().st_mtime))
+            return found
+
+        # Look in data/downloads/ and the user Downloads folder
+        csv_files = find_exported_csvs(data_downloads_dir)
+        csv_files.extend(find_exported_csvs(user_downloads_dir))
+
         if csv_files:
-            # Sort by modification time, most recent first
-            csv_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            exported_csv = csv_files[0]
+            # Sort by the cached modification time, most recent first
+            csv_files.sort(key=lambda x: x[1], reverse=True)
+            exported_csv = csv_files[0][0]
             print(f"Found: {os.path.basename(exported_csv)}")
         else:
             print("No exported CSV found in data/downloads/ or Downloads folder.")
@@ -96,8 +99,10 @@ def main():
         shutil.copy2(target_file, backup_file)
         print(f"\n✅ Backed up original file to: {backup_file}")
     
-    # Copy the exported CSV to replace the existing file
-    shutil.copy2(exported_csv, target_file)
+    # Copy the exported CSV to replace the existing file; copyfile can use
+    # the kernel's zero-copy path, and the destination's old metadata is
+    # irrelevant since we're overwriting it anyway
+    shutil.copyfile(exported_csv, target_file)
     print(f"✅ Replaced show data file: {target_file}")
     
     # Also update the webapp shows_data.csv
@@ -107,7 +112,7 @@ def main():
         shutil.copy2(webapp_file, backup_webapp)
         print(f"✅ Backed up webapp file to: {backup_webapp}")
     
-    shutil.copy2(exported_csv, webapp_file)
+    shutil.copyfile(exported_csv, webapp_file)
     print(f"✅ Updated webapp file: {webapp_file}")
     
     print(f"\n✅ All done! Your show changes have been applied.")
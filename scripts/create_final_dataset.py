@@ -4,12 +4,26 @@ Create Final Velour Show Dataset
 Processes the scraped data and creates a clean, analysis-ready dataset
 """
 
-import json
-import pandas as pd
+import csv
+import mmap
+import orjson
+import re
+from collections import Counter
 from datetime import datetime
 from typing import List, Dict
 import os
 
+# Title classification patterns, compiled once at import; a single regex
+# scan replaces several per-title substring searches
+_SPECIAL_EVENT_RE = re.compile(r'prom|dance|special|event', re.IGNORECASE)
+_FESTIVAL_RE = re.compile(r'Festival|FilmQuest')
+
+def csv_to_tsv(csv_path: str, tsv_path: str):
+    """Derive a TSV from an already-written CSV with a stdlib re-quote pass
+    instead of serializing every cell a second time"""
+    with open(csv_path, 'r', newline='') as src, open(tsv_path, 'w', newline='') as dst:
+        csv.writer(dst, delimiter='\t').writerows(csv.reader(src))
+
 def create_final_dataset():
     """Create the final dataset from the parsed shows"""
     print("=== Creating Final Velour Show Dataset ===\n")
@@ -20,8 +34,11 @@ def create_final_dataset():
     # Load the parsed shows data
     try:
         parsed_file = os.path.join(project_root, 'data', 'processed', 'velour_parsed_shows_20251011_143618.json')
-        with open(parsed_file, 'r') as f:
-            shows = json.load(f)
+        # Memory-map the multi-MB file and parse straight out of the page
+        # cache instead of read()-ing a private copy first
+        with open(parsed_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                shows = orjson.loads(memoryview(mm))
         
         print(f"Loaded {len(shows)} shows from parsed data")
         
@@ -46,90 +63,101 @@ def create_final_dataset():
 
 def clean_show_data(shows: List[Dict]) -> List[Dict]:
     """Clean and enhance the show data"""
-    cleaned = []
-    
-    for show in shows:
-        # Clean the title
-        title = show.get('title') or ''
-        title = str(title).strip()
-        if not title or title in ['', 'None']:
-            continue
-        
-        # Clean the genre
-        genre = show.get('genre') or ''
-        genre = str(genre).strip()
-        if not genre or genre == 'None':
-            genre = 'Unknown'
-        
-        # Clean the artists
-        artists = show.get('artists') or ''
-        artists = str(artists).strip()
-        if not artists or artists == 'None':
-            artists = ''
-        
-        # Clean the description
-        description = show.get('description') or ''
-        description = str(description).strip()
-        
-        # Create a clean show entry
-        clean_show = {
-            'date': show.get('date', ''),
-            'day': show.get('day', ''),
-            'month': show.get('month', ''),
-            'year': show.get('year', ''),
-            'title': title,
-            'genre': genre,
-            'artists': artists,
-            'description': description,
-            'venue': 'Velour Live Music Gallery',
-            'is_open_mic': 'Open-Mic' in title,
-            'is_festival': 'Festival' in title or 'FilmQuest' in title,
-            'is_special_event': any(keyword in title.lower() for keyword in ['prom', 'dance', 'special', 'event']),
-            'extracted_at': show.get('extracted_at', datetime.now().isoformat())
-        }
-        
-        cleaned.append(clean_show)
-    
-    return cleaned
+    import pandas as pd
+
+    df = pd.DataFrame(shows)
+
+    # Make sure every expected column exists, then clean column-at-a-time
+    # with pandas string ops instead of per-row Python
+    for col in ('date', 'day', 'month', 'year', 'title', 'genre',
+                'artists', 'description', 'extracted_at'):
+        if col not in df.columns:
+            df[col] = ''
+
+    def stripped(col):
+        series = df[col]
+        return series.where(series.notna(), '').astype(str).str.strip()
+
+    # Drop shows without a usable title
+    df['title'] = stripped('title')
+    df = df[~df['title'].isin(['', 'None'])]
+
+    title = df['title']
+    extracted_at = df['extracted_at'].where(df['extracted_at'].notna(),
+                                            datetime.now().isoformat())
+
+    out = pd.DataFrame({
+        'date': df['date'].where(df['date'].notna(), ''),
+        'day': df['day'].where(df['day'].notna(), ''),
+        'month': df['month'].where(df['month'].notna(), ''),
+        'year': df['year'].where(df['year'].notna(), ''),
+        'title': title,
+        'genre': stripped('genre').replace({'': 'Unknown', 'None': 'Unknown'}),
+        'artists': stripped('artists').replace({'None': ''}),
+        'description': stripped('description'),
+        'venue': 'Velour Live Music Gallery',
+        'is_open_mic': title.str.contains('Open-Mic', regex=False),
+        'is_festival': title.str.contains(_FESTIVAL_RE),
+        'is_special_event': title.str.contains(_SPECIAL_EVENT_RE),
+        'extracted_at': extracted_at
+    })
+
+    # astype(object) boxes numpy scalars back to native Python values so
+    # the records serialize exactly like the old per-row dicts
+    return out.astype(object).to_dict('records')
 
 def create_summary_statistics(shows: List[Dict]) -> Dict:
     """Create summary statistics for the dataset"""
     if not shows:
         return {}
-    
-    # Date range
-    dates = [show['date'] for show in shows if show['date']]
-    dates.sort()
-    
-    # Genre breakdown
-    genres = {}
+
+    # One pass over the shows builds every breakdown at once
+    genres = Counter()
+    monthly = Counter()
+    open_mic = festivals = special_events = regular = 0
+    earliest = latest = None
+
     for show in shows:
-        genre = show.get('genre', 'Unknown')
-        genres[genre] = genres.get(genre, 0) + 1
-    
-    # Event type breakdown
+        genres[show.get('genre', 'Unknown')] += 1
+        monthly[show.get('month', 'Unknown')] += 1
+
+        # Bind the flags once instead of re-doing the dict lookups in the
+        # regular-show check
+        is_open_mic = show['is_open_mic']
+        is_festival = show['is_festival']
+        is_special = show['is_special_event']
+        if is_open_mic:
+            open_mic += 1
+        if is_festival:
+            festivals += 1
+        if is_special:
+            special_events += 1
+        if not (is_open_mic or is_festival or is_special):
+            regular += 1
+
+        date = show['date']
+        if date:
+            if earliest is None or date < earliest:
+                earliest = date
+            if latest is None or date > latest:
+                latest = date
+
     event_types = {
-        'Open Mic': len([s for s in shows if s['is_open_mic']]),
-        'Festivals': len([s for s in shows if s['is_festival']]),
-        'Special Events': len([s for s in shows if s['is_special_event']]),
-        'Regular Shows': len([s for s in shows if not any([s['is_open_mic'], s['is_festival'], s['is_special_event']])])
+        'Open Mic': open_mic,
+        'Festivals': festivals,
+        'Special Events': special_events,
+        'Regular Shows': regular
     }
-    
-    # Monthly breakdown
-    monthly = {}
-    for show in shows:
-        month = show.get('month', 'Unknown')
-        monthly[month] = monthly.get(month, 0) + 1
-    
+
     return {
         'total_shows': len(shows),
         'date_range': {
-            'earliest': dates[0] if dates else 'N/A',
-            'latest': dates[-1] if dates else 'N/A'
+            'earliest': earliest if earliest is not None else 'N/A',
+            'latest': latest if latest is not None else 'N/A'
         },
-        'genres': genres,
+        'genres': dict(genres),
         'event_types': event_types,
-        'monthly_breakdown': monthly,
+        'monthly_breakdown': dict(monthly),
         'venue': 'Velour Live Music Gallery',
         'data_source': 'https://velourlive.com/calendar/index.php',
         'created_at': datetime.now().isoformat()
@@ -139,31 +167,39 @@ def save_final_dataset(shows: List[Dict], summary: Dict, project_root: str):
     """Save the final dataset and summary"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Ensure directories exist
-    os.makedirs(os.path.join(project_root, 'data', 'exports'), exist_ok=True)
-    os.makedirs(os.path.join(project_root, 'data', 'processed'), exist_ok=True)
-    
-    # Save main dataset as CSV
-    df = pd.DataFrame(shows)
-    csv_file = os.path.join(project_root, 'data', 'exports', f'velour_final_dataset_{timestamp}.csv')
-    df.to_csv(csv_file, index=False)
+    # Bind the output directories once instead of re-joining them per file
+    exports_dir = os.path.join(project_root, 'data', 'exports')
+    processed_dir = os.path.join(project_root, 'data', 'processed')
+    os.makedirs(exports_dir, exist_ok=True)
+    os.makedirs(processed_dir, exist_ok=True)
+
+    # Save main dataset as CSV; the cleaned shows all share one schema, so
+    # stream the dicts straight through csv.DictWriter rather than paying
+    # for a DataFrame build and dtype inference first
+    fieldnames = list(shows[0].keys()) if shows else []
+    csv_file = os.path.join(exports_dir, f'velour_final_dataset_{timestamp}.csv')
+    with open(csv_file, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+        writer.writeheader()
+        writer.writerows(shows)
     print(f"Final dataset saved to: {csv_file}")
     
-    # Save as JSON
-    json_file = os.path.join(project_root, 'data', 'exports', f'velour_final_dataset_{timestamp}.json')
-    with open(json_file, 'w') as f:
-        json.dump(shows, f, indent=2, default=str)
+    # Save as JSON (orjson skips the slow pure-Python indent formatting
+    # on the full shows list)
+    json_file = os.path.join(exports_dir, f'velour_final_dataset_{timestamp}.json')
+    with open(json_file, 'wb') as f:
+        f.write(orjson.dumps(shows, option=orjson.OPT_INDENT_2, default=str))
     print(f"Final dataset saved to: {json_file}")
-    
+
     # Save summary report
-    summary_file = os.path.join(project_root, 'data', 'processed', f'velour_summary_report_{timestamp}.json')
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2, default=str)
+    summary_file = os.path.join(processed_dir, f'velour_summary_report_{timestamp}.json')
+    with open(summary_file, 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2, default=str))
     print(f"Summary report saved to: {summary_file}")
     
-    # Create a TSV file as requested
-    tsv_file = os.path.join(project_root, 'data', 'exports', f'velour_final_dataset_{timestamp}.tsv')
-    df.to_csv(tsv_file, index=False, sep='\t')
+    # Create a TSV file as requested, derived from the CSV just written
+    tsv_file = os.path.join(exports_dir, f'velour_final_dataset_{timestamp}.tsv')
+    csv_to_tsv(csv_file, tsv_file)
     print(f"TSV file saved to: {tsv_file}")
     
     # Print summary to console
@@ -4,27 +4,69 @@ Download All Historical Data
 Downloads and saves all historical Velour Live data to exports folder
 """
 
+import csv
 import time
-import json
+import orjson
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-import pandas as pd
 import os
-import requests
-from bs4 import BeautifulSoup
+
+# Special-event keywords compiled once; one case-insensitive regex scan
+# replaces four per-title substring searches plus the .lower() copy
+_SPECIAL_EVENT_RE = re.compile(r'prom|dance|special|event', re.IGNORECASE)
+
+# Month names fixed to English regardless of locale, so filenames and the
+# calendar URLs stay stable; also avoids a datetime+strftime per month
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December')
+
+def csv_to_tsv(csv_path: str, tsv_path: str):
+    """Derive a TSV from an already-written CSV with a stdlib re-quote pass
+    instead of serializing every cell a second time"""
+    with open(csv_path, 'r', newline='') as src, open(tsv_path, 'w', newline='') as dst:
+        csv.writer(dst, delimiter='\t').writerows(csv.reader(src))
 
 class DownloadAllHistoricalData:
     def __init__(self):
+        # Imported here so just importing the module (e.g. for the helpers)
+        # doesn't pay the requests startup cost
+        import requests
+        from urllib3.util.retry import Retry
+
         self.base_url = "https://velourlive.com"
         self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.all_shows: List[Dict] = []
         
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate'
         })
-        
+        # Pool sized for the concurrent month fetches so the worker threads
+        # share kept-alive connections; transient 5xx/429 responses and
+        # timeouts retry in-band with backoff instead of losing the month
+        retry = Retry(total=5, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=('GET',))
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                                max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Simple shared rate limiter: requests reserve 0.2s slots so the
+        # overall rate stays polite (~5 req/s) regardless of worker count
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+        # On-disk cache of raw month HTML so an interrupted download can
+        # resume without re-fetching months we already have
+        self.cache_dir = os.path.join(self.project_root, 'data', 'cache', 'velour_html')
+        os.makedirs(self.cache_dir, exist_ok=True)
+
         # Import the historical parser
         from parse_velour_historical import VelourHistoricalParser
         self.parser = VelourHistoricalParser()
@@ -37,74 +79,113 @@ class DownloadAllHistoricalData:
         print()
         
         all_shows = []
-        total_months = (end_year - start_year + 1) * 12
+        tasks = [(year, month) for year in range(start_year, end_year + 1)
+                 for month in range(1, 13)]
+        total_months = len(tasks)
+
+        def fetch(task):
+            year, month = task
+            month_name = _MONTH_NAMES[month - 1]
+            try:
+                return year, month, month_name, self._download_month_year(month, year, month_name), None
+            except Exception as e:
+                return year, month, month_name, [], e
+
+        # Append-only progress log: each show is written once as it arrives
+        # instead of rewriting the entire list every 200 shows
+        logs_dir = os.path.join(self.project_root, 'logs')
+        os.makedirs(logs_dir, exist_ok=True)
+        progress_path = os.path.join(
+            logs_dir, f"progress_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson")
+        print(f"💾 Progress log: {progress_path}")
+        print()
+
+        # The month fetches are independent and network-bound, so overlap
+        # them; the shared rate limiter keeps the request rate polite and
+        # executor.map yields results back in calendar order
         current_month = 0
-        
-        for year in range(start_year, end_year + 1):
-            print(f"📅 Year {year}:")
-            year_shows = 0
-            
-            for month in range(1, 13):
+        current_year = None
+        year_shows = 0
+
+        with open(progress_path, 'ab') as progress_file, \
+                ThreadPoolExecutor(max_workers=8) as executor:
+            for year, month, month_name, month_shows, error in executor.map(fetch, tasks):
+                if year != current_year:
+                    if current_year is not None:
+                        print(f"  📊 Year {current_year} total: {year_shows} shows")
+                        print()
+                    print(f"📅 Year {year}:")
+                    current_year = year
+                    year_shows = 0
+
                 current_month += 1
-                month_name = datetime(2000, month, 1).strftime('%B')
-                
                 print(f"  [{current_month:3d}/{total_months}] {month_name:9s} {year}...", end=" ")
-                
-                try:
-                    month_shows = self._download_month_year(month, year, month_name)
-                    
-                    if month_shows:
-                        all_shows.extend(month_shows)
-                        year_shows += len(month_shows)
-                        print(f"✅ {len(month_shows):2d} shows")
-                    else:
-                        print("❌ No shows")
-                    
-                    # Save progress every 200 shows
-                    if len(all_shows) % 200 == 0 and len(all_shows) > 0:
-                        self._save_progress(all_shows, f"progress_{year}_{month:02d}")
-                        print(f"    💾 Progress saved: {len(all_shows)} shows")
-                    
-                    time.sleep(0.2)  # Be respectful
-                    
-                except Exception as e:
-                    print(f"❌ Error: {str(e)[:30]}...")
+
+                if error:
+                    print(f"❌ Error: {str(error)[:30]}...")
                     continue
-            
-            print(f"  📊 Year {year} total: {year_shows} shows")
+
+                if month_shows:
+                    all_shows.extend(month_shows)
+                    year_shows += len(month_shows)
+                    for show in month_shows:
+                        progress_file.write(orjson.dumps(show, default=str))
+                        progress_file.write(b'\n')
+                    print(f"✅ {len(month_shows):2d} shows")
+                else:
+                    print("❌ No shows")
+
+        if current_year is not None:
+            print(f"  📊 Year {current_year} total: {year_shows} shows")
             print()
-        
+
         self.all_shows = all_shows
         print(f"🎉 Download Complete!")
         print(f"📊 Total shows collected: {len(all_shows)}")
         
         return all_shows
     
+    def _throttle(self):
+        """Reserve the next request slot; blocks so the overall request
+        rate across all worker threads stays at ~5 req/s"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + 0.2
+        if wait > 0:
+            time.sleep(wait)
+
     def _download_month_year(self, month: int, year: int, month_name: str) -> List[Dict]:
         """Download shows for a specific month and year"""
         try:
-            # Use the discovered URL pattern
-            url = f"{self.base_url}/calendar/month.php?month={month}&year={year}"
-            
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
+            # Serve the month from the on-disk cache when we already have it.
+            # The HTML stays as bytes end to end — BeautifulSoup does its own
+            # encoding detection, so decoding via response.text here would
+            # just be an extra full-page pass
+            cache_path = os.path.join(self.cache_dir, f'{year}_{month:02d}.html')
+            if os.path.exists(cache_path) and os.path.getsize(cache_path) > 0:
+                with open(cache_path, 'rb') as f:
+                    html = f.read()
+            else:
+                # Use the discovered URL pattern
+                url = f"{self.base_url}/calendar/month.php?month={month}&year={year}"
+
+                self._throttle()
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+                html = response.content
+
+                with open(cache_path, 'wb') as f:
+                    f.write(html)
+
             # Parse the HTML content using the historical parser
-            shows = self.parser.parse_historical_calendar(response.text, month_name, year)
-            
+            shows = self.parser.parse_historical_calendar(html, month_name, year)
+
             return shows
-            
+
         except Exception as e:
             raise Exception(f"Download error: {e}")
     
-    def _save_progress(self, shows: List[Dict], filename_prefix: str):
-        """Save progress periodically"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = os.path.join(self.project_root, 'logs', f"{filename_prefix}_{timestamp}.json")
-        
-        with open(filename, 'w') as f:
-            json.dump(shows, f, indent=2, default=str)
-    
     def save_to_exports(self, filename: str = None) -> Dict[str, str]:
         """Save the complete historical dataset to exports folder"""
         if not self.all_shows:
@@ -114,36 +195,47 @@ class DownloadAllHistoricalData:
         if filename is None:
             filename = f"velour_complete_historical_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
-        # Ensure exports directory exists
-        os.makedirs(os.path.join(self.project_root, 'data', 'exports'), exist_ok=True)
-        
+        # Bind the exports directory once instead of re-joining it per file
+        exports_dir = os.path.join(self.project_root, 'data', 'exports')
+        os.makedirs(exports_dir, exist_ok=True)
+
         files_created = {}
-        
-        # Save as CSV
-        df = pd.DataFrame(self.all_shows)
-        csv_file = os.path.join(self.project_root, 'data', 'exports', f"{filename}.csv")
-        df.to_csv(csv_file, index=False)
+
+        # Save as CSV, streaming the show dicts straight through the stdlib
+        # csv module — no DataFrame build or dtype inference needed just to
+        # dump rows
+        fieldnames = list(dict.fromkeys(key for show in self.all_shows for key in show))
+        csv_file = os.path.join(exports_dir, f"{filename}.csv")
+        with open(csv_file, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            writer.writeheader()
+            writer.writerows(self.all_shows)
         files_created['csv'] = csv_file
         print(f"📄 CSV saved: {csv_file}")
         
-        # Save as TSV
-        tsv_file = os.path.join(self.project_root, 'data', 'exports', f"{filename}.tsv")
-        df.to_csv(tsv_file, index=False, sep='\t')
+        # Save as TSV, derived from the CSV just written
+        tsv_file = os.path.join(exports_dir, f"{filename}.tsv")
+        csv_to_tsv(csv_file, tsv_file)
         files_created['tsv'] = tsv_file
         print(f"📄 TSV saved: {tsv_file}")
         
-        # Save as JSON
-        json_file = os.path.join(self.project_root, 'data', 'exports', f"{filename}.json")
-        with open(json_file, 'w') as f:
-            json.dump(self.all_shows, f, indent=2, default=str)
+        # Save as JSON (orjson serializes the 20-year show list far faster
+        # than the stdlib encoder with indent=2)
+        json_file = os.path.join(exports_dir, f"{filename}.json")
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps(self.all_shows, option=orjson.OPT_INDENT_2, default=str))
         files_created['json'] = json_file
         print(f"📄 JSON saved: {json_file}")
-        
+
         # Create a summary file
         summary = self._create_summary()
-        summary_file = os.path.join(self.project_root, 'data', 'exports', f"{filename}_summary.json")
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2, default=str)
+        summary_file = os.path.join(exports_dir, f"{filename}_summary.json")
+        with open(summary_file, 'wb') as f:
+            # shows_by_year is keyed by int years; OPT_NON_STR_KEYS coerces
+            # them to strings the way stdlib json did
+            f.write(orjson.dumps(summary,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                 default=str))
         files_created['summary'] = summary_file
         print(f"📄 Summary saved: {summary_file}")
         
@@ -153,31 +245,47 @@ class DownloadAllHistoricalData:
         """Create a comprehensive summary of the data"""
         if not self.all_shows:
             return {}
-        
-        # Year breakdown
-        years = {}
-        for show in self.all_shows:
-            year = show.get('year', 'Unknown')
-            years[year] = years.get(year, 0) + 1
-        
-        # Genre breakdown
-        genres = {}
+
+        # Build every breakdown in one pass over the shows instead of
+        # re-walking the full list per statistic
+        years = Counter()
+        genres = Counter()
+        monthly = Counter()
+        open_mic = festivals = special_events = regular = 0
+        earliest = latest = None
+
         for show in self.all_shows:
-            genre = show.get('genre') or 'Unknown'
-            genres[genre] = genres.get(genre, 0) + 1
-        
-        # Event type breakdown
+            years[show.get('year', 'Unknown')] += 1
+            genres[show.get('genre') or 'Unknown'] += 1
+            monthly[show.get('month', 'Unknown')] += 1
+
+            title = show.get('title', '')
+            is_open_mic = 'Open-Mic' in title
+            is_festival = 'Festival' in title
+            is_special = bool(_SPECIAL_EVENT_RE.search(title))
+            if is_open_mic:
+                open_mic += 1
+            if is_festival:
+                festivals += 1
+            if is_special:
+                special_events += 1
+            if not (is_open_mic or is_festival or is_special):
+                regular += 1
+
+            date = show.get('date')
+            if date:
+                if earliest is None or date < earliest:
+                    earliest = date
+                if latest is None or date > latest:
+                    latest = date
+
         event_types = {
-            'Open Mic': len([s for s in self.all_shows if 'Open-Mic' in s.get('title', '')]),
-            'Festivals': len([s for s in self.all_shows if 'Festival' in s.get('title', '')]),
-            'Special Events': len([s for s in self.all_shows if any(keyword in s.get('title', '').lower() for keyword in ['prom', 'dance', 'special', 'event'])]),
-            'Regular Shows': len([s for s in self.all_shows if not any([
-                'Open-Mic' in s.get('title', ''),
-                'Festival' in s.get('title', ''),
-                any(keyword in s.get('title', '').lower() for keyword in ['prom', 'dance', 'special', 'event'])
-            ])])
+            'Open Mic': open_mic,
+            'Festivals': festivals,
+            'Special Events': special_events,
+            'Regular Shows': regular
         }
-        
+
         return {
             'collection_info': {
                 'total_shows': len(self.all_shows),
@@ -186,38 +294,32 @@ class DownloadAllHistoricalData:
                 'data_source': 'https://velourlive.com/calendar/month.php',
                 'years_covered': list(years.keys()),
                 'date_range': {
-                    'earliest': min([s.get('date', '') for s in self.all_shows if s.get('date')]),
-                    'latest': max([s.get('date', '') for s in self.all_shows if s.get('date')])
+                    'earliest': earliest,
+                    'latest': latest
                 }
             },
-            'shows_by_year': years,
-            'shows_by_genre': dict(sorted(genres.items(), key=lambda x: x[1], reverse=True)[:20]),
+            'shows_by_year': dict(years),
+            'shows_by_genre': dict(genres.most_common(20)),
             'event_types': event_types,
             'top_artists': self._get_top_artists(),
-            'monthly_averages': self._get_monthly_averages()
+            'monthly_averages': dict(monthly)
         }
     
     def _get_top_artists(self) -> List[Dict]:
         """Get top performing artists"""
-        artist_counts = {}
-        for show in self.all_shows:
-            title = show.get('title', '')
-            if title and 'Open-Mic' not in title and 'Festival' not in title:
-                # Simple artist extraction
-                artists = title.split(' w/ ')[0].strip()
-                if artists:
-                    artist_counts[artists] = artist_counts.get(artists, 0) + 1
-        
-        return [{'artist': artist, 'shows': count} for artist, count in sorted(artist_counts.items(), key=lambda x: x[1], reverse=True)[:20]]
-    
-    def _get_monthly_averages(self) -> Dict:
-        """Get monthly averages across all years"""
-        monthly_counts = {}
-        for show in self.all_shows:
-            month = show.get('month', 'Unknown')
-            monthly_counts[month] = monthly_counts.get(month, 0) + 1
-        
-        return monthly_counts
+        # Counter aggregates in C, and most_common(20) keeps a bounded heap
+        # instead of sorting every artist; split(' w/ ', 1) stops at the
+        # first separator rather than scanning the whole title
+        artist_counts = Counter(
+            title.split(' w/ ', 1)[0].strip()
+            for show in self.all_shows
+            for title in (show.get('title', ''),)
+            if title and 'Open-Mic' not in title and 'Festival' not in title
+            and title.split(' w/ ', 1)[0].strip()
+        )
+
+        return [{'artist': artist, 'shows': count}
+                for artist, count in artist_counts.most_common(20)]
     
     def print_final_summary(self):
         """Print final summary"""
@@ -229,7 +331,8 @@ class DownloadAllHistoricalData:
         print(f"🎉 VELOUR LIVE HISTORICAL DATA DOWNLOAD COMPLETE! 🎉")
         print(f"{'='*60}")
         print(f"📊 Total Shows: {len(self.all_shows):,}")
-        print(f"📅 Years Covered: {min(self.all_shows, key=lambda x: x.get('year', 9999)).get('year')} - {max(self.all_shows, key=lambda x: x.get('year', 0)).get('year')}")
+        years = [show.get('year') for show in self.all_shows if show.get('year') is not None]
+        print(f"📅 Years Covered: {min(years)} - {max(years)}")
         print(f"🏢 Venue: Velour Live Music Gallery")
         print(f"📁 Files saved to: data/exports/")
         print(f"{'='*60}")
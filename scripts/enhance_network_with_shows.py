@@ -4,11 +4,33 @@ Enhance Network Data with Show Details
 Adds show dates and details to network edges for visualization
 """
 
-import json
+import mmap
+import orjson
 import os
+import re
+import sys
 from collections import defaultdict
+from functools import lru_cache
+from itertools import combinations
 from datetime import datetime
 
+# Title patterns compiled once at import; a single regex pass per show
+# replaces the per-title substring scans and ad-hoc splits
+_SKIP_RE = re.compile(r'open[- ]mic|prom|dance|festival', re.IGNORECASE)
+_WSPLIT_RE = re.compile(r'\s+w/\s+')
+_GENRE_PREFIX_RE = re.compile(r'^\([^)]*\)\s*')
+
+@lru_cache(maxsize=16384)
+def _normalize_artist(artist: str) -> str:
+    """Normalize an artist name, returning '' for names too short to keep
+
+    The same bands appear across many shows, so the cache makes repeat
+    normalizations a single dict hit; interning means each name's hash is
+    computed once no matter how many pairs it lands in.
+    """
+    normalized = artist.lower().strip()
+    return sys.intern(normalized) if len(normalized) > 2 else ''
+
 def enhance_network_with_shows():
     """Enhance network JSON with show details for each connection"""
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -29,25 +51,33 @@ def enhance_network_with_shows():
         'velour_complete_historical_20260102_205023.json'
     )
     
+    # orjson's C parser/serializer is several times faster than the stdlib
+    # on these multi-MB files
     print("Loading network data...")
-    with open(network_file, 'r') as f:
-        network_data = json.load(f)
-    
+    with open(network_file, 'rb') as f:
+        network_data = orjson.loads(f.read())
+
+    # Memory-map the shows export and parse straight out of the page cache
+    # instead of read()-ing a private copy of the whole file first
     print("Loading show data...")
-    with open(shows_file, 'r') as f:
-        all_shows = json.load(f)
+    with open(shows_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            all_shows = orjson.loads(memoryview(mm))
     
     # Build a map of artist pairs to shows
     print("Building artist pair to shows mapping...")
     pair_to_shows = defaultdict(list)
     
     for show in all_shows:
-        if not show.get('date') or not show.get('title'):
+        # Cheap structural checks first; rows without a date or title never
+        # reach the regex scan or artist extraction
+        date = show.get('date')
+        title = show.get('title')
+        if not date or not title:
             continue
-        
+
         # Skip open mic and other non-band events
-        title = show.get('title', '').lower()
-        if any(skip in title for skip in ['open-mic', 'open mic', 'prom', 'dance', 'festival']):
+        if _SKIP_RE.search(title):
             continue
         
         # Extract artists from the show (simplified version)
@@ -62,61 +92,57 @@ def enhance_network_with_shows():
         
         # From title (if no artists field)
         if not artists:
-            title_field = show.get('title', '')
-            if ' w/ ' in title_field:
-                parts = title_field.split(' w/ ', 1)
-                headliner = parts[0].strip()
-                # Remove genre prefix
-                headliner = headliner.split(') ', 1)[-1] if ') ' in headliner else headliner
-                artists.append(headliner)
-                if len(parts) > 1:
-                    artists.extend([a.strip() for a in parts[1].split(',') if a.strip()])
-            elif ',' in title_field:
+            parts = _WSPLIT_RE.split(title, 1)
+            if len(parts) == 2:
+                # Remove genre prefix from the headliner
+                artists.append(_GENRE_PREFIX_RE.sub('', parts[0]).strip())
+                artists.extend([a.strip() for a in parts[1].split(',') if a.strip()])
+            elif ',' in title:
                 # List of artists
-                title_clean = title_field.split(') ', 1)[-1] if ') ' in title_field else title_field
+                title_clean = _GENRE_PREFIX_RE.sub('', title)
                 artists.extend([a.strip() for a in title_clean.split(',') if a.strip()])
         
-        # Normalize artist names
-        normalized_artists = []
-        for artist in artists:
-            normalized = artist.lower().strip()
-            if normalized and len(normalized) > 2:
-                normalized_artists.append(normalized)
-        
-        # Create pairs and add to mapping
+        # Normalize artist names through the memoized helper
+        normalized_artists = [a for a in map(_normalize_artist, artists) if a]
+
+        # Create pairs and add to mapping; one payload dict per show is
+        # shared by every pair on the bill instead of copied per pair
         if len(normalized_artists) > 1:
-            for i, artist1 in enumerate(normalized_artists):
-                for artist2 in normalized_artists[i+1:]:
-                    pair = tuple(sorted([artist1, artist2]))
-                    pair_to_shows[pair].append({
-                        'date': show.get('date', ''),
-                        'title': show.get('title', ''),
-                        'genre': show.get('genre', ''),
-                        'description': show.get('description', '')
-                    })
+            payload = {
+                'date': date,
+                'title': title,
+                'genre': show.get('genre', ''),
+                'description': show.get('description', '')
+            }
+            for artist1, artist2 in combinations(normalized_artists, 2):
+                pair = ((artist1, artist2) if artist1 < artist2
+                        else (artist2, artist1))
+                pair_to_shows[pair].append(payload)
     
     print(f"Found {len(pair_to_shows)} artist pairs with show data")
-    
-    # Enhance edges with show details
+
+    # Freeze to a plain dict so a stray lookup can't grow it, and misses
+    # below return None instead of minting an empty list each
+    pair_to_shows = dict(pair_to_shows)
+
+    # Enhance edges with show details, mutating each edge in place rather
+    # than rebuilding the list from copies
     print("Enhancing edges with show details...")
-    enhanced_edges = []
-    
-    for edge in network_data['edges']:
+    edges = network_data['edges']
+
+    for edge in edges:
         source = edge['source']
         target = edge['target']
-        pair = tuple(sorted([source, target]))
-        
-        shows = pair_to_shows.get(pair, [])
-        
-        enhanced_edge = edge.copy()
-        enhanced_edge['shows'] = shows[:10]  # Limit to 10 shows for performance
-        enhanced_edge['total_shows'] = len(shows)
-        
-        enhanced_edges.append(enhanced_edge)
-    
-    # Update network data
-    network_data['edges'] = enhanced_edges
-    
+        pair = (source, target) if source < target else (target, source)
+
+        shows = pair_to_shows.get(pair)
+        if shows:
+            edge['shows'] = shows[:10]  # Limit to 10 shows for performance
+            edge['total_shows'] = len(shows)
+        else:
+            edge['shows'] = []
+            edge['total_shows'] = 0
+
     # Save enhanced network
     output_file = os.path.join(
         project_root,
@@ -125,12 +151,30 @@ def enhance_network_with_shows():
         'artist_network_enhanced_20260102_211457.json'
     )
     
-    with open(output_file, 'w') as f:
-        json.dump(network_data, f, indent=2, default=str)
-    
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(network_data,
+                             option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                             default=str))
+
+    # Also emit a streaming-friendly sidecar: one edge per line, plus a
+    # small header with everything but the edges, so consumers can process
+    # the graph without materializing the full enhanced file
+    ndjson_file = output_file.replace('.json', '.edges.ndjson')
+    with open(ndjson_file, 'wb') as f:
+        for edge in edges:
+            f.write(orjson.dumps(edge, default=str))
+            f.write(b'\n')
+
+    header_file = output_file.replace('.json', '.header.json')
+    header = {key: value for key, value in network_data.items() if key != 'edges'}
+    with open(header_file, 'wb') as f:
+        f.write(orjson.dumps(header, option=orjson.OPT_INDENT_2, default=str))
+
     print(f"✅ Enhanced network saved to: {output_file}")
-    print(f"   Total edges: {len(enhanced_edges)}")
-    print(f"   Edges with show data: {sum(1 for e in enhanced_edges if e.get('shows'))}")
+    print(f"✅ Edge stream saved to: {ndjson_file}")
+    print(f"✅ Header saved to: {header_file}")
+    print(f"   Total edges: {len(edges)}")
+    print(f"   Edges with show data: {sum(1 for e in edges if e.get('shows'))}")
 
 if __name__ == "__main__":
     enhance_network_with_shows()
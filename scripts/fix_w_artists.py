@@ -6,103 +6,124 @@ Splits artist entries that contain "w/" into separate artists and updates networ
 
 import json
 import csv
+import mmap
+import orjson
 import os
 import re
+import shutil
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
+
+# Every pattern compiled once at import; the splitting and extraction loops
+# run these tens of thousands of times, and going through re.sub/re.split
+# with a string pattern pays the module cache lookup on each call
+_W_SPLIT_RE = re.compile(r'\s+w/\s+|\s+w/|w/\s+|w/', re.IGNORECASE)
+_PRICE_SOLD_RE = re.compile(r'\$\d+|SOLD OUT', re.IGNORECASE)
+_PRICE_TAIL_RE = re.compile(r'\s*\$\d+.*$', re.IGNORECASE)
+_SOLD_OUT_TAIL_RE = re.compile(r'\s*\*?\s*SOLD OUT.*$', re.IGNORECASE)
+_GENRE_PREFIX_RE = re.compile(r'^\([^)]+\)\s*')
+_TIME_PREFIX_RE = re.compile(r'^\d+pm[»\s]*')
+
+# Edge characters trimmed off split parts; str.strip with this set replaces
+# the old anchored character-class regex
+_EDGE_CHARS = '"\',\t\n\r $*!()'
 
 def load_artists(csv_file):
     """Load artists from CSV"""
-    artists = []
-    with open(csv_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            artists.append({
-                'artist_name': row['artist_name'],
-                'normalized_name': row['normalized_name'],
-                'total_shows': int(row['total_shows']) if row['total_shows'] else 0,
-                'connection_count': int(row['connection_count']) if row['connection_count'] else 0,
-                'first_year': int(row['first_year']) if row['first_year'] else None,
-                'last_year': int(row['last_year']) if row['last_year'] else None,
-                'years_span': int(row['years_span']) if row['years_span'] else 0,
-                'years_active': json.loads(row['years_active']) if row['years_active'] else []
-            })
-    return artists
+    import pandas as pd
+
+    # Columnar read: the UTF-8 decode and integer parsing happen in C
+    # column-at-a-time instead of per-row DictReader dispatch and casts
+    int_cols = ('total_shows', 'connection_count', 'first_year', 'last_year', 'years_span')
+    df = pd.read_csv(csv_file, dtype={col: 'Int64' for col in int_cols})
+
+    for col in ('artist_name', 'normalized_name'):
+        df[col] = df[col].fillna('')
+    for col in ('total_shows', 'connection_count', 'years_span'):
+        df[col] = df[col].fillna(0).astype(object)
+    for col in ('first_year', 'last_year'):
+        # Box to native ints with None for missing years, matching the
+        # old per-row casts
+        series = df[col].astype(object)
+        df[col] = series.where(series.notna(), None)
+    df['years_active'] = df['years_active'].fillna('[]').map(json.loads)
+
+    return df.to_dict('records')
 
 def load_shows_data(json_file):
     """Load original shows data to find which shows have the split artists"""
-    with open(json_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # Memory-map the multi-MB export and parse straight out of the page
+    # cache with orjson instead of read()-ing a private copy through the
+    # stdlib decoder
+    with open(json_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return orjson.loads(memoryview(mm))
 
+@lru_cache(maxsize=4096)
 def split_artist_name(name):
-    """Split an artist name that contains 'w/' into separate names"""
+    """Split an artist name that contains 'w/' into separate names
+
+    Cached since the same names recur across runs of the loop; returns a
+    tuple (hashable, safe to share) or None.
+    """
+    lowered = name.lstrip().lower()
+
     # Skip if name starts with "w/" (incomplete entry, no artist before it)
-    if re.match(r'^\s*w/\s*', name, re.IGNORECASE):
+    if lowered.startswith('w/'):
         return None
-    
+
+    # Cheap literal check first: most names carry no 'w/' at all, and they
+    # never reach the split regex
+    if 'w/' not in lowered:
+        return None
+
     # Look for "w/" pattern (case insensitive) - with or without spaces
     # Pattern: space(s) + w/ + space(s) OR just w/ (no spaces)
-    pattern = r'\s+w/\s+|\s+w/|w/\s+|w/'
-    parts = re.split(pattern, name, flags=re.IGNORECASE)
-    
+    # (split the original name so the parts keep their casing)
+    parts = _W_SPLIT_RE.split(name)
+
     if len(parts) > 1:
-        # Clean up each part
+        # Clean up each part; everything here is plain C string ops — the
+        # regex engine only runs for the rarer price/sold-out metadata
         cleaned_parts = []
         for part in parts:
-            part = part.strip()
-            # Remove leading/trailing quotes, commas, dollar signs, asterisks, parentheses, etc.
-            part = re.sub(r'^["\',\s$*!()]+|["\',\s$*!()]+$', '', part)
-            # Remove extra spaces
-            part = re.sub(r'\s+', ' ', part).strip()
+            # Remove leading/trailing quotes, commas, dollar signs, asterisks,
+            # parentheses, etc., and collapse extra spaces
+            part = ' '.join(part.strip(_EDGE_CHARS).split())
             # Remove trailing punctuation like "SOLD OUT!" but keep if it's part of the name
             # Only remove if it's clearly metadata (all caps, common phrases)
-            if re.search(r'\$\d+|SOLD OUT|sold out', part, re.IGNORECASE):
-                part = re.sub(r'\s*\$\d+.*$', '', part, flags=re.IGNORECASE)
-                part = re.sub(r'\s*\*?\s*SOLD OUT.*$', '', part, flags=re.IGNORECASE)
+            if _PRICE_SOLD_RE.search(part):
+                part = _PRICE_TAIL_RE.sub('', part)
+                part = _SOLD_OUT_TAIL_RE.sub('', part)
                 part = part.strip()
             # Remove trailing quotes that might be from parsing
-            part = re.sub(r'^["\']+|["\']+$', '', part)
+            part = part.strip('"\'')
             # Clean up quotes in the middle (like "Ferocious Oaks"Reunion"")
-            part = re.sub(r'""+', ' ', part)  # Replace multiple quotes with space
-            part = re.sub(r'\s+', ' ', part).strip()  # Clean up extra spaces
+            while '""' in part:
+                part = part.replace('""', ' ')  # Replace multiple quotes with space
+            part = ' '.join(part.split())  # Clean up extra spaces
             # Skip if too short or just punctuation
-            if part and len(part) > 1 and not re.match(r'^[^a-zA-Z0-9]+$', part):
+            if len(part) > 1 and any(c.isalnum() for c in part):
                 cleaned_parts.append(part)
         
         # Only return if we have at least 2 valid parts
-        return cleaned_parts if len(cleaned_parts) > 1 else None
-    
+        return tuple(cleaned_parts) if len(cleaned_parts) > 1 else None
+
     return None
 
+@lru_cache(maxsize=65536)
 def normalize_name(name):
     """Normalize artist name for matching"""
-    return name.lower().strip()
-
-def find_shows_with_artist(shows_data, artist_name, normalized_name):
-    """Find all shows that mention this artist"""
-    matching_shows = []
-    
-    for show in shows_data:
-        if not show.get('date') or not show.get('title'):
-            continue
-        
-        # Skip open mic and other non-band events
-        title = show.get('title', '').lower()
-        if any(skip in title for skip in ['open-mic', 'open mic', 'prom', 'dance', 'festival']):
-            continue
-        
-        # Check if artist appears in title, description, or artists field
-        title_field = show.get('title', '')
-        desc_field = show.get('description', '')
-        artists_field = show.get('artists', '')
-        
-        # Check various fields
-        search_text = f"{title_field} {desc_field} {artists_field}".lower()
-        
-        if normalized_name in search_text or artist_name.lower() in search_text:
-            matching_shows.append(show)
-    
-    return matching_shows
+    # NFKC folds typographic variants (curly quotes, ligatures, full-width
+    # forms) and casefold handles non-ASCII case, so near-duplicate names
+    # land on one canonical key; interning collapses the hundreds of copies
+    # a recurring band name would otherwise leave in counts, mappings, and
+    # per-show sets to one shared object with a cached hash
+    return sys.intern(unicodedata.normalize('NFKC', name).casefold().strip())
 
 def create_new_artist(name, base_artist, shows_count=0):
     """Create a new artist entry"""
@@ -122,7 +143,7 @@ def create_new_artist(name, base_artist, shows_count=0):
 def extract_artists_from_show(show):
     """Extract normalized artist names from a show"""
     artists = []
-    
+
     # From artists field
     if show.get('artists'):
         artist_str = str(show['artists']).strip()
@@ -132,32 +153,55 @@ def extract_artists_from_show(show):
                 a = a.strip()
                 if a:
                     artists.append(normalize_name(a))
-    
+
     # From title
-    title = show.get('title', '')
-    if ' w/ ' in title.lower() or 'w/' in title.lower():
-        # Split by w/
-        pattern = r'\s+w/\s+|\s+w/|w/\s+|w/'
-        parts = re.split(pattern, title, flags=re.IGNORECASE)
-        
+    artists.extend(_artists_from_title(show.get('title', '')))
+
+    return list(set(artists))  # Remove duplicates
+
+@lru_cache(maxsize=8192)
+def _artists_from_title(title):
+    """Extract normalized artist names from a show title
+
+    Split out of extract_artists_from_show and cached: multi-night
+    bookings repeat titles, so the regex cascade runs once per distinct
+    title instead of once per show.
+    """
+    artists = []
+    lowered = title.lower()
+    if 'w/' in lowered:
+        # Slice the original title at each 'w/' located in the lowered
+        # copy, so the parts keep their casing; the whitespace the old
+        # split regex swallowed falls to the strips below
+        parts = []
+        start = 0
+        idx = lowered.find('w/')
+        while idx != -1:
+            parts.append(title[start:idx])
+            start = idx + 2
+            idx = lowered.find('w/', start)
+        parts.append(title[start:])
+
         # Clean first part (headliner)
-        if parts:
-            headliner = parts[0].strip()
-            # Remove genre prefix
-            headliner = re.sub(r'^\([^)]+\)\s*', '', headliner)
-            headliner = re.sub(r'^\d+pm[»\s]*', '', headliner)
-            headliner = headliner.strip('"').strip()
-            if headliner:
-                artists.append(normalize_name(headliner))
-        
-        # Clean remaining parts (openers)
+        headliner = parts[0].strip()
+        # Remove genre prefix
+        headliner = _GENRE_PREFIX_RE.sub('', headliner)
+        headliner = _TIME_PREFIX_RE.sub('', headliner)
+        headliner = headliner.strip('"').strip()
+        if headliner:
+            artists.append(normalize_name(headliner))
+
+        # Clean remaining parts (openers); the tail regexes only run for
+        # the rare openers that actually carry price/sold-out metadata
         for part in parts[1:]:
             # Split by comma if multiple openers
             for opener in part.split(','):
                 opener = opener.strip()
                 # Clean up
-                opener = re.sub(r'\s*\$\d+.*$', '', opener, flags=re.IGNORECASE)
-                opener = re.sub(r'\s*\*?\s*SOLD OUT.*$', '', opener, flags=re.IGNORECASE)
+                if '$' in opener:
+                    opener = _PRICE_TAIL_RE.sub('', opener)
+                if 'sold out' in opener.lower():
+                    opener = _SOLD_OUT_TAIL_RE.sub('', opener)
                 opener = opener.strip('"').strip()
                 if opener:
                     artists.append(normalize_name(opener))
@@ -168,8 +212,17 @@ def extract_artists_from_show(show):
             a = a.strip()
             if a:
                 artists.append(normalize_name(a))
-    
-    return list(set(artists))  # Remove duplicates
+
+    return tuple(artists)
+
+def _count_show_artists(shows):
+    """Count artist appearances across one chunk of shows (pool worker)"""
+    counts = Counter()
+    for show in shows:
+        if not show.get('date') or not show.get('title'):
+            continue
+        counts.update(extract_artists_from_show(show))
+    return counts
 
 def fix_artists_with_w():
     """Main function to fix artists with 'w/' in names"""
@@ -190,13 +243,12 @@ def fix_artists_with_w():
     # Find artists with "w/" in name
     artists_to_split = []
     for artist in artists:
-        if 'w/' in artist['artist_name'].lower() or ' w/ ' in artist['artist_name'].lower():
-            split_names = split_artist_name(artist['artist_name'])
-            if split_names:
-                artists_to_split.append({
-                    'original': artist,
-                    'split_names': split_names
-                })
+        split_names = split_artist_name(artist['artist_name'])
+        if split_names:
+            artists_to_split.append({
+                'original': artist,
+                'split_names': split_names
+            })
     
     print(f"\nFound {len(artists_to_split)} artists with 'w/' that need splitting:")
     for item in artists_to_split[:10]:  # Show first 10
@@ -212,7 +264,11 @@ def fix_artists_with_w():
     new_artists = []
     artists_to_remove = set()
     artist_name_mapping = {}  # Maps old normalized names to new ones
-    
+
+    # One dict build up front turns the existing-artist check below from an
+    # O(N) scan per split name into a lookup
+    artists_by_norm = {a['normalized_name']: a for a in artists}
+
     for item in artists_to_split:
         original = item['original']
         split_names = item['split_names']
@@ -226,8 +282,8 @@ def fix_artists_with_w():
             normalized = normalize_name(name)
             
             # Check if this artist already exists
-            existing = next((a for a in artists if a['normalized_name'] == normalized), None)
-            
+            existing = artists_by_norm.get(normalized)
+
             if existing:
                 # Artist already exists, we'll merge the shows
                 print(f"  Note: '{name}' already exists, will merge shows")
@@ -240,44 +296,49 @@ def fix_artists_with_w():
                 artist_name_mapping[original_normalized] = normalized
                 print(f"  Created new artist: '{name}'")
     
-    # Remove original artists and add new ones
-    fixed_artists = [a for a in artists if a['normalized_name'] not in artists_to_remove]
-    fixed_artists.extend(new_artists)
-    
-    # Count shows for each artist by checking the shows data
+    # Remove original artists and add new ones, keyed by normalized name so
+    # the show-count update below is random access instead of a full rescan
+    fixed_by_norm = {norm: a for norm, a in artists_by_norm.items()
+                     if norm not in artists_to_remove}
+    for artist in new_artists:
+        fixed_by_norm[artist['normalized_name']] = artist
+
+    # Count shows for each artist by checking the shows data. Each show is
+    # independent and the extraction is regex-heavy, so fan the work out
+    # across cores in ~500-show chunks and merge the partial Counters
     print("\nCounting shows for split artists...")
-    artist_show_counts = defaultdict(int)
-    
-    for show in shows_data:
-        if not show.get('date') or not show.get('title'):
-            continue
-        
-        # Extract artists from show
-        show_artists = extract_artists_from_show(show)
-        
-        for artist_norm in show_artists:
-            artist_show_counts[artist_norm] += 1
+    chunk_size = 500
+    chunks = [shows_data[i:i + chunk_size]
+              for i in range(0, len(shows_data), chunk_size)]
+
+    artist_show_counts = Counter()
+    with ProcessPoolExecutor() as executor:
+        for counts in executor.map(_count_show_artists, chunks):
+            artist_show_counts.update(counts)
     
     # Update show counts
-    for artist in fixed_artists:
-        if artist['normalized_name'] in artist_show_counts:
-            artist['total_shows'] = artist_show_counts[artist['normalized_name']]
-    
+    for norm, count in artist_show_counts.items():
+        artist = fixed_by_norm.get(norm)
+        if artist is not None:
+            artist['total_shows'] = count
+
+    fixed_artists = list(fixed_by_norm.values())
+
     print(f"\nFixed artists: {len(fixed_artists)} (removed {len(artists_to_remove)}, added {len(new_artists)})")
     
     # Save fixed artists CSV
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_csv = os.path.join(project_root, 'data', 'processed', f'artists_fixed_{timestamp}.csv')
     
-    with open(output_csv, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['artist_name', 'normalized_name', 'total_shows', 
-                                               'connection_count', 'years_active', 'first_year', 
+    # writerows iterates internally, and the large buffer batches the libc
+    # write calls for the full artist list
+    with open(output_csv, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=['artist_name', 'normalized_name', 'total_shows',
+                                               'connection_count', 'years_active', 'first_year',
                                                'last_year', 'years_span'])
         writer.writeheader()
-        for artist in fixed_artists:
-            row = artist.copy()
-            row['years_active'] = json.dumps(artist['years_active'])
-            writer.writerow(row)
+        writer.writerows({**artist, 'years_active': json.dumps(artist['years_active'])}
+                         for artist in fixed_artists)
     
     print(f"✅ Fixed artists saved to: {output_csv}")
     
@@ -291,16 +352,22 @@ def fix_artists_with_w():
     webapp_network = os.path.join(project_root, 'webapp', 'network_data.json')
     
     if os.path.exists(webapp_artists):
-        import shutil
-        shutil.copy(output_csv, webapp_artists)
+        # Copy through a temp file and atomically swap it in; a hard link
+        # would alias the archived snapshot to a path other scripts rewrite
+        # in place (apply_editor_changes.py copies onto it), which would
+        # corrupt the processed CSV
+        tmp_csv = webapp_artists + '.tmp'
+        shutil.copyfile(output_csv, tmp_csv)
+        os.replace(tmp_csv, webapp_artists)
         print(f"✅ Updated webapp artists file: {webapp_artists}")
     
     print("\n✅ All done! Artists with 'w/' have been split.")
 
 def update_network_file(network_file, name_mapping, fixed_artists, timestamp):
     """Update network JSON file with split artists"""
-    with open(network_file, 'r', encoding='utf-8') as f:
-        network_data = json.load(f)
+    with open(network_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            network_data = orjson.loads(memoryview(mm))
     
     # Create lookup for fixed artists
     fixed_artists_lookup = {a['normalized_name']: a for a in fixed_artists}
@@ -327,11 +394,12 @@ def update_network_file(network_file, name_mapping, fixed_artists, timestamp):
         
         updated_nodes.append(node)
     
-    # Add new nodes for split artists
+    # Add new nodes for split artists; the id set makes the existence check
+    # O(1) instead of rescanning updated_nodes per artist
+    node_ids = {n['id'] for n in updated_nodes}
     for artist in fixed_artists:
-        # Check if node already exists
-        existing_node = next((n for n in updated_nodes if n['id'] == artist['normalized_name']), None)
-        if not existing_node:
+        if artist['normalized_name'] not in node_ids:
+            node_ids.add(artist['normalized_name'])
             updated_nodes.append({
                 'id': artist['normalized_name'],
                 'label': artist['artist_name'],
@@ -339,35 +407,32 @@ def update_network_file(network_file, name_mapping, fixed_artists, timestamp):
                 'shows': artist['total_shows']
             })
     
-    # Update edges - remove edges with removed nodes, update source/target names
-    updated_edges = []
+    # Update edges in one pass: drop edges touching removed nodes, remap
+    # renamed endpoints, and deduplicate as we go instead of rebuilding an
+    # intermediate list and rescanning it
+    seen_edges = set()
+    final_edges = []
     for edge in network_data['edges']:
         source = edge['source']
         target = edge['target']
-        
+
         # Skip if either node was removed
         if source in nodes_to_remove or target in nodes_to_remove:
             continue
-        
+
         # Update edge if names changed
-        if source in name_mapping:
-            source = name_mapping[source]
-        if target in name_mapping:
-            target = name_mapping[target]
-        
+        source = name_mapping.get(source, source)
+        target = name_mapping.get(target, target)
+
+        edge_key = (source, target) if source <= target else (target, source)
+        if edge_key in seen_edges:
+            continue
+        seen_edges.add(edge_key)
+
         edge['source'] = source
         edge['target'] = target
-        updated_edges.append(edge)
-    
-    # Remove duplicate edges
-    seen_edges = set()
-    final_edges = []
-    for edge in updated_edges:
-        edge_key = tuple(sorted([edge['source'], edge['target']]))
-        if edge_key not in seen_edges:
-            seen_edges.add(edge_key)
-            final_edges.append(edge)
-    
+        final_edges.append(edge)
+
     network_data['nodes'] = updated_nodes
     network_data['edges'] = final_edges
     network_data['metadata']['updated_at'] = datetime.now().isoformat()
@@ -379,18 +444,22 @@ def update_network_file(network_file, name_mapping, fixed_artists, timestamp):
         f'artist_network_fixed_{timestamp}.json'
     )
     
-    with open(output_network, 'w', encoding='utf-8') as f:
-        json.dump(network_data, f, indent=2, default=str)
-    
+    # Serialize once; the timestamped output and the webapp copy are
+    # byte-identical, so the second encode was pure waste
+    buf = orjson.dumps(network_data, option=orjson.OPT_INDENT_2, default=str)
+
+    with open(output_network, 'wb') as f:
+        f.write(buf)
+
     print(f"✅ Updated network saved to: {output_network}")
     print(f"   Nodes: {len(updated_nodes)}")
     print(f"   Edges: {len(final_edges)}")
-    
+
     # Also update webapp file
     webapp_network = os.path.join(os.path.dirname(os.path.dirname(network_file)), 'webapp', 'network_data.json')
     if os.path.exists(os.path.dirname(webapp_network)):
-        with open(webapp_network, 'w', encoding='utf-8') as f:
-            json.dump(network_data, f, indent=2, default=str)
+        with open(webapp_network, 'wb') as f:
+            f.write(buf)
         print(f"✅ Updated webapp network file: {webapp_network}")
 
 if __name__ == "__main__":
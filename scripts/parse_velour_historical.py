@@ -5,7 +5,7 @@ Parses the historical calendar format with individual event links
 """
 
 import re
-import json
+import orjson
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import pandas as pd
@@ -245,8 +245,8 @@ class VelourHistoricalParser:
         if filename is None:
             filename = f"velour_historical_shows_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
-        with open(filename, 'w') as f:
-            json.dump(self.shows, f, indent=2, default=str)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(self.shows, option=orjson.OPT_INDENT_2, default=str))
         
         print(f"Historical shows data saved to: {filename}")
         return filename